@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from nlpaug.augmenter.char.keyboard import KeyboardAug
-
 
 def keyboard_typo(
     instances: list[str] | str,
@@ -50,6 +48,7 @@ def keyboard_typo(
     Returns:
         A list of perturbed instances.
     """
+    from nlpaug.augmenter.char.keyboard import KeyboardAug
 
     kwargs["aug_char_p"] = kwargs.get("aug_char_p", 0.1)
     kwargs["aug_char_max"] = kwargs.get("aug_char_max")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from nlpaug.augmenter.char.ocr import OcrAug
-
 
 def ocr_typo(
     instances: list[str] | str,
@@ -48,6 +46,7 @@ def ocr_typo(
     Returns:
         A list of perturbed instances.
     """
+    from nlpaug.augmenter.char.ocr import OcrAug
 
     kwargs["aug_char_p"] = kwargs.get("aug_char_p", 0.1)
     kwargs["aug_char_max"] = kwargs.get("aug_char_max")
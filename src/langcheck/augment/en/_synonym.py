@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import nltk
-from nlpaug.augmenter.word import SynonymAug
 
 
 def synonym(
@@ -38,6 +37,7 @@ def synonym(
     Returns:
         A list of perturbed instances.
     """
+    from nlpaug.augmenter.word import SynonymAug
 
     kwargs["aug_p"] = kwargs.get("aug_p", 0.1)
     kwargs["aug_max"] = kwargs.get("aug_max")
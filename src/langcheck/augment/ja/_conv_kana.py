@@ -3,6 +3,69 @@ from __future__ import annotations
 import random
 
 import jaconv
+import numpy as np
+
+
+def _build_conv_table(convert_func) -> dict[str, str]:
+    """Precompute a per-character conversion table for a jaconv converter.
+
+    The 0x3000-0x30FF range covers every codepoint that the jaconv converters
+    change for single-character inputs, so looking up a character in the
+    returned table (falling back to the character itself) is equivalent to
+    calling the converter on that character.
+    """
+    return {
+        chr(code): convert_func(chr(code))
+        for code in range(0x3000, 0x3100)
+        if convert_func(chr(code)) != chr(code)
+    }
+
+
+# Build the tables once at import time so the perturbation loop below is a
+# plain dict lookup instead of a jaconv call per character.
+_CONV_TABLES: dict[str, dict[str, str]] = {
+    "kata": _build_conv_table(jaconv.hira2kata),
+    "hkata": _build_conv_table(jaconv.hira2hkata),
+    "alpha": _build_conv_table(jaconv.kana2alphabet),
+}
+
+# str.maketrans versions of the same tables for the aug_char_p == 1.0 case,
+# where str.translate converts the whole string in C without a Python loop.
+_TRANS_TABLES: dict[str, dict[int, str]] = {
+    convert_to: str.maketrans(conv_table)
+    for convert_to, conv_table in _CONV_TABLES.items()
+}
+
+# All codepoints that the conversion tables can map to fit below this bound.
+_LUT_SIZE = 0x3100
+
+
+def _build_codepoint_lut(conv_table: dict[str, str]) -> np.ndarray | None:
+    """Build a codepoint lookup table for a conversion table.
+
+    The table maps each codepoint below _LUT_SIZE to its converted
+    codepoint (or to itself when the conversion leaves it unchanged), so a
+    whole string can be converted with a single NumPy fancy-indexing
+    operation. Returns None when any conversion produces more than one
+    character (e.g. 'alpha'), since those cannot be expressed as a
+    codepoint-to-codepoint table.
+    """
+    if any(len(converted) != 1 for converted in conv_table.values()):
+        return None
+    lut = np.arange(_LUT_SIZE, dtype=np.uint32)
+    for char, converted in conv_table.items():
+        lut[ord(char)] = ord(converted)
+    return lut
+
+
+_CODEPOINT_LUTS: dict[str, np.ndarray | None] = {
+    convert_to: _build_codepoint_lut(conv_table)
+    for convert_to, conv_table in _CONV_TABLES.items()
+}
+
+# Below this length, the plain Python loop is faster than the NumPy
+# encode/decode round trip.
+_MIN_LUT_LENGTH = 256
 
 
 def conv_hiragana(
@@ -35,28 +98,59 @@ def conv_hiragana(
     if aug_char_p < 0 or aug_char_p > 1:
         raise ValueError("aug_char_p must be between 0 and 1")
 
+    if convert_to not in _CONV_TABLES:
+        raise ValueError(
+            "convert_to must be one of 'kata', 'hkata', or 'alpha'"
+        )
+    conv_table = _CONV_TABLES[convert_to]
+
     if seed is not None:
         random.seed(seed)
 
     instances = [instances] if isinstance(instances, str) else instances
+    # Bind the bound method to a local to skip the module attribute lookup on
+    # every draw in the perturbation loop.
+    _random = random.random
     perturbed_instances = []
     for instance in instances:
         for _ in range(num_perturbations):
-            perturbed_instance = ""
-            for char in instance:
-                if random.random() > aug_char_p:
-                    perturbed_instance += char  # No augmentation
-                else:
-                    if convert_to == "kata":
-                        perturbed_instance += jaconv.hira2kata(char)
-                    elif convert_to == "hkata":
-                        perturbed_instance += jaconv.hira2hkata(char)
-                    elif convert_to == "alpha":
-                        perturbed_instance += jaconv.kana2alphabet(char)
-                    else:
-                        raise ValueError(
-                            "convert_to must be one of 'kata', 'hkata', or 'alpha'"
-                        )
-            perturbed_instances.append(perturbed_instance)
+            if aug_char_p == 1.0:
+                # Every character is augmented, so no random draws are needed.
+                perturbed_instances.append(
+                    instance.translate(_TRANS_TABLES[convert_to])
+                )
+                continue
+
+            # Draw one random number per character, in the same order as the
+            # characters, so that a fixed seed keeps choosing the same
+            # characters to augment.
+            rands = [_random() for _ in range(len(instance))]
+
+            lut = _CODEPOINT_LUTS[convert_to]
+            if lut is not None and len(instance) >= _MIN_LUT_LENGTH:
+                # Map the whole string through the codepoint table in one
+                # vectorized pass. The random draws above are the same ones
+                # the Python loop below would consume, so a fixed seed picks
+                # the same characters on both paths.
+                codepoints = np.frombuffer(
+                    instance.encode("utf-32-le"), dtype=np.uint32
+                )
+                mask = (np.asarray(rands) <= aug_char_p) & (
+                    codepoints < _LUT_SIZE
+                )
+                converted = np.where(
+                    mask, lut[np.where(mask, codepoints, 0)], codepoints
+                )
+                perturbed_instances.append(
+                    converted.tobytes().decode("utf-32-le")
+                )
+                continue
+
+            perturbed_instances.append(
+                "".join(
+                    conv_table.get(char, char) if rand <= aug_char_p else char
+                    for char, rand in zip(instance, rands)
+                )
+            )
 
     return perturbed_instances
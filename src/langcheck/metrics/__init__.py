@@ -38,6 +38,7 @@ from langcheck.metrics.en.source_based_text_quality import (
 )
 from langcheck.metrics.metric_value import MetricValue
 from langcheck.metrics.reference_based_text_quality import exact_match
+from langcheck.metrics.scorer._base import clear_cache
 from langcheck.metrics.text_structure import (
     contains_all_strings,
     contains_any_strings,
@@ -56,6 +57,7 @@ __all__ = [
     "answer_correctness",
     "answer_relevance",
     "answer_safety",
+    "clear_cache",
     "contains_all_strings",
     "contains_any_strings",
     "contains_regex",
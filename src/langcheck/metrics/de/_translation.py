@@ -1,7 +1,6 @@
 from math import floor
 
 from nltk.tokenize import sent_tokenize
-from transformers.pipelines import pipeline
 
 
 class Translate:
@@ -14,6 +13,8 @@ class Translate:
         Args:
             model_name: The name of the model to use for translation
         """
+        from transformers.pipelines import pipeline
+
         self._translation_pipeline = pipeline(
             "translation",
             model=model_name,
@@ -8,9 +8,6 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.hf_models import (
-    SentenceTransformerSimilarityScorer,
-)
 from langcheck.utils.progress_bar import tqdm_wrapper
 
 LANG = "de"
@@ -64,6 +61,10 @@ def semantic_similarity(
     )
 
     if eval_model == "local":
+        from langcheck.metrics.scorer.hf_models import (
+            SentenceTransformerSimilarityScorer,
+        )
+
         scorer = SentenceTransformerSimilarityScorer(language=LANG)
     else:  # EvalClient
         assert isinstance(eval_model, EvalClient), (
@@ -15,12 +15,7 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.detoxify_models import DetoxifyScorer
-from langcheck.metrics.scorer.hf_models import (
-    AutoModelForSequenceClassificationScorer,
-)
-from langcheck.stats import compute_stats
-from langcheck.utils.progress_bar import tqdm_wrapper
+from langcheck.stats import compute_stats_batch, stats_to_arrays
 
 _translation_model_path = "Helsinki-NLP/opus-mt-de-en"
 
@@ -128,6 +123,10 @@ def _sentiment_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="de",
         metric="sentiment",
@@ -319,6 +318,8 @@ def _toxicity_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.detoxify_models import DetoxifyScorer
+
     return DetoxifyScorer(lang=LANG, overflow_strategy=overflow_strategy).score(
         generated_outputs
     )
@@ -368,16 +369,11 @@ def flesch_reading_ease(
         required_params=["generated_outputs"],
     )
 
-    output_stats = [
-        compute_stats(output)
-        for output in tqdm_wrapper(generated_outputs, desc="Computing stats")
-    ]
-    scores = [
-        180
-        - (stat.num_words / stat.num_sentences)
-        - 58.5 * (stat.num_syllables / stat.num_words)
-        for stat in output_stats
-    ]
+    output_stats = compute_stats_batch(generated_outputs)
+    num_sentences, num_words, num_syllables = stats_to_arrays(output_stats)
+    scores = (
+        180 - (num_words / num_sentences) - 58.5 * (num_syllables / num_words)
+    ).tolist()
     return MetricValue(
         metric_name="flesch_reading_ease",
         metric_inputs=metric_inputs,
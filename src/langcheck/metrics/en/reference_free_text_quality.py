@@ -9,12 +9,7 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.detoxify_models import DetoxifyScorer
-from langcheck.metrics.scorer.hf_models import (
-    AutoModelForSequenceClassificationScorer,
-)
-from langcheck.stats import compute_stats
-from langcheck.utils.progress_bar import tqdm_wrapper
+from langcheck.stats import compute_stats_batch, stats_to_arrays
 
 LANG = "en"
 
@@ -117,6 +112,10 @@ def _sentiment_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="en",
         metric="sentiment",
@@ -227,6 +226,10 @@ def _fluency_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="en",
         metric="fluency",
@@ -351,6 +354,8 @@ def _toxicity_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.detoxify_models import DetoxifyScorer
+
     return DetoxifyScorer(overflow_strategy=overflow_strategy).score(
         generated_outputs
     )
@@ -383,16 +388,13 @@ def flesch_reading_ease(
         required_params=["generated_outputs"],
     )
 
-    output_stats = [
-        compute_stats(output)
-        for output in tqdm_wrapper(generated_outputs, desc="Computing stats")
-    ]
-    scores = [
+    output_stats = compute_stats_batch(generated_outputs)
+    num_sentences, num_words, num_syllables = stats_to_arrays(output_stats)
+    scores = (
         206.835
-        - 1.015 * (stat.num_words / stat.num_sentences)
-        - 84.6 * (stat.num_syllables / stat.num_words)
-        for stat in output_stats
-    ]
+        - 1.015 * (num_words / num_sentences)
+        - 84.6 * (num_syllables / num_words)
+    ).tolist()
 
     return MetricValue(
         metric_name="flesch_reading_ease",
@@ -433,16 +435,13 @@ def flesch_kincaid_grade(
         required_params=["generated_outputs"],
     )
 
-    output_stats = [
-        compute_stats(output)
-        for output in tqdm_wrapper(generated_outputs, desc="Computing stats")
-    ]
-    scores = [
-        0.39 * (stat.num_words / stat.num_sentences)
-        + 11.8 * (stat.num_syllables / stat.num_words)
+    output_stats = compute_stats_batch(generated_outputs)
+    num_sentences, num_words, num_syllables = stats_to_arrays(output_stats)
+    scores = (
+        0.39 * (num_words / num_sentences)
+        + 11.8 * (num_syllables / num_words)
         - 15.59
-        for stat in output_stats
-    ]
+    ).tolist()
     return MetricValue(
         metric_name="flesch_kincaid_grade",
         metric_inputs=metric_inputs,
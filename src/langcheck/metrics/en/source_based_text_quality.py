@@ -1,11 +1,6 @@
 from __future__ import annotations
 
 import nltk
-import torch
-import torch.nn as nn
-from transformers.models.auto.configuration_auto import AutoConfig
-from transformers.models.auto.modeling_auto import AutoModelForSeq2SeqLM
-from transformers.models.auto.tokenization_auto import AutoTokenizer
 
 from langcheck.metrics.eval_clients import EvalClient
 from langcheck.metrics.metric_inputs import (
@@ -122,6 +117,12 @@ def _factual_consistency_local(
     Returns:
         A list of scores
     """
+    import torch
+    import torch.nn as nn
+    from transformers.models.auto.configuration_auto import AutoConfig
+    from transformers.models.auto.modeling_auto import AutoModelForSeq2SeqLM
+    from transformers.models.auto.tokenization_auto import AutoTokenizer
+
     # Confirm necessary data for nltk.tokenize.sent_tokenize() exists
     try:
         nltk.data.find("tokenizers/punkt_tab")
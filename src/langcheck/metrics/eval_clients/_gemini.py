@@ -3,9 +3,8 @@ from __future__ import annotations
 import asyncio
 import os
 import warnings
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import torch
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
@@ -20,6 +19,9 @@ from ..scorer._base import BaseSimilarityScorer
 from ._base import EvalClient
 from .extractor import Extractor
 
+if TYPE_CHECKING:
+    import torch
+
 
 class GeminiEvalClient(EvalClient):
     """EvalClient defined for the Gemini model."""
@@ -207,6 +209,8 @@ class GeminiSimilarityScorer(BaseSimilarityScorer):
 
     def _embed(self, inputs: list[str]) -> torch.Tensor:
         """Embed the inputs using the Gemini API."""
+        import torch
+
         if self._use_async:
 
             async def _call_async_api():
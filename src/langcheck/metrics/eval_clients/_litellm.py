@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import instructor
 import litellm
-import torch
 from litellm.cost_calculator import cost_per_token
 from litellm.types.utils import EmbeddingResponse
 from openai.types.chat import ChatCompletionMessageParam
@@ -23,6 +22,9 @@ from ..scorer._base import BaseSimilarityScorer
 from ._base import EvalClient, TextResponseWithLogProbs
 from .extractor import Extractor
 
+if TYPE_CHECKING:
+    import torch
+
 
 class LiteLLMEvalClient(EvalClient):
     """EvalClient defined for litellm."""
@@ -611,6 +613,8 @@ class LiteLLMSimilarityScorer(BaseSimilarityScorer):
 
     def _embed(self, inputs: list[str]) -> torch.Tensor:
         """Embed the inputs."""
+        import torch
+
         if self._use_async:
             # TODO: For Gemini, this outputs some warnings about async client
             # session. https://github.com/BerriAI/litellm/issues/12108
@@ -2,12 +2,7 @@
 
 from __future__ import annotations
 
-from transformers.models.auto.tokenization_auto import AutoTokenizer
-from transformers.tokenization_utils import (
-    PreTrainedTokenizer,
-)
-from transformers.tokenization_utils_fast import PreTrainedTokenizerFast
-from vllm import LLM, SamplingParams
+from typing import TYPE_CHECKING
 
 from langcheck.metrics.eval_clients.eval_response import (
     MetricTokenUsage,
@@ -18,6 +13,26 @@ from ..prompts._utils import get_template
 from ._base import EvalClient
 from .extractor import Extractor
 
+if TYPE_CHECKING:
+    from transformers.tokenization_utils import PreTrainedTokenizer
+    from transformers.tokenization_utils_fast import PreTrainedTokenizerFast
+    from vllm import LLM, SamplingParams
+
+
+def _import_vllm():
+    """Import vllm lazily, with an install hint when it is missing."""
+    try:
+        from vllm import LLM, SamplingParams
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "No module named 'vllm'.\n"
+            "Since the local Llama-based eval clients are an optional "
+            "feature, 'vllm' is not installed by default along with "
+            "langcheck. Please install it with "
+            "`pip install langcheck[local-llm]`."
+        )
+    return LLM, SamplingParams
+
 
 class LlamaEvalClient(EvalClient):
     """EvalClient defined for the Llama-based models.
@@ -59,6 +74,9 @@ class LlamaEvalClient(EvalClient):
             extractor: (Optional) The extractor to use. If not provided, the
                 default extractor will be used.
         """
+        LLM, SamplingParams = _import_vllm()
+        from transformers.models.auto.tokenization_auto import AutoTokenizer
+
         self._model = LLM(
             model=model_name,
             max_model_len=8192,
@@ -213,6 +231,9 @@ class LlamaExtractor(Extractor):
         sampling_params: SamplingParams | None = None,
         system_prompt: str | None = None,
     ):
+        LLM, SamplingParams = _import_vllm()
+        from transformers.models.auto.tokenization_auto import AutoTokenizer
+
         self._model = model or LLM(
             model=model_name,
             max_model_len=8192,
@@ -3,9 +3,8 @@ from __future__ import annotations
 import asyncio
 import os
 import warnings
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import torch
 from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 from pydantic import BaseModel
@@ -20,6 +19,9 @@ from ..scorer._base import BaseSimilarityScorer
 from ._base import EvalClient, TextResponseWithLogProbs
 from .extractor import Extractor, StringMatchExtractor
 
+if TYPE_CHECKING:
+    import torch
+
 
 class OpenAIEvalClient(EvalClient):
     """EvalClient defined for OpenAI API."""
@@ -124,8 +126,8 @@ class OpenAIEvalClient(EvalClient):
             async def _call_async_api() -> list[Any]:
                 responses = await asyncio.gather(
                     *map(
-                        lambda model_input: self._client.chat.completions.create(
-                            **model_input
+                        lambda model_input: (
+                            self._client.chat.completions.create(**model_input)
                         ),
                         model_inputs,
                     ),
@@ -654,6 +656,7 @@ class OpenAISimilarityScorer(BaseSimilarityScorer):
 
     def _embed(self, inputs: list[str]) -> torch.Tensor:
         """Embed the inputs using the OpenAI API."""
+        import torch
 
         if self._use_async:
             try:
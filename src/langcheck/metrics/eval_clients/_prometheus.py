@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from jinja2 import Template
-from transformers.models.auto.tokenization_auto import AutoTokenizer
-from vllm import LLM, SamplingParams
+from typing import TYPE_CHECKING
 
 from langcheck.metrics.eval_clients.eval_response import (
     ResponsesWithMetadata,
@@ -10,8 +8,12 @@ from langcheck.metrics.eval_clients.eval_response import (
 
 from ..prompts._utils import get_template
 from ._base import EvalClient
+from ._llama import _import_vllm
 from .extractor import Extractor, StringMatchExtractor
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
 class PrometheusEvalClient(EvalClient):
     """EvalClient defined for the Prometheus 2 model.
@@ -46,6 +48,9 @@ class PrometheusEvalClient(EvalClient):
             extractor: (Optional) The extractor to use. If not provided, the
                 default extractor will be used.
         """
+        LLM, SamplingParams = _import_vllm()
+        from transformers.models.auto.tokenization_auto import AutoTokenizer
+
         self._model = LLM(
             model=model_name,
             max_model_len=8192,
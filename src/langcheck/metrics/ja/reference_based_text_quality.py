@@ -10,9 +10,6 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.hf_models import (
-    SentenceTransformerSimilarityScorer,
-)
 from langcheck.utils.progress_bar import tqdm_wrapper
 
 LANG = "ja"
@@ -109,6 +106,10 @@ def semantic_similarity(
     )
 
     if eval_model == "local":
+        from langcheck.metrics.scorer.hf_models import (
+            SentenceTransformerSimilarityScorer,
+        )
+
         scorer = SentenceTransformerSimilarityScorer(language="ja")
     else:  # EvalClient
         assert isinstance(eval_model, EvalClient), (
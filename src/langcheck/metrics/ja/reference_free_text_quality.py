@@ -8,9 +8,6 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.hf_models import (
-    AutoModelForSequenceClassificationScorer,
-)
 from langcheck.utils.progress_bar import tqdm_wrapper
 
 LANG = "ja"
@@ -118,6 +115,10 @@ def _sentiment_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="ja",
         metric="sentiment",
@@ -254,6 +255,10 @@ def _toxicity_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="ja",
         metric="toxicity",
@@ -370,6 +375,10 @@ def _fluency_local(
     Returns:
         A list of scores
     """
+    from langcheck.metrics.scorer.hf_models import (
+        AutoModelForSequenceClassificationScorer,
+    )
+
     scorer = AutoModelForSequenceClassificationScorer(
         language="ja",
         metric="fluency",
@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-from typing import cast
-
-from transformers.pipelines import pipeline
-from transformers.pipelines.base import Pipeline
+from typing import TYPE_CHECKING, cast
 
 from langcheck.metrics.en.source_based_text_quality import (
     factual_consistency as en_factual_consistency,
@@ -16,6 +13,9 @@ from langcheck.metrics.metric_inputs import (
 from langcheck.metrics.metric_value import MetricValue
 from langcheck.utils.progress_bar import tqdm_wrapper
 
+if TYPE_CHECKING:
+    from transformers.pipelines.base import Pipeline
+
 _factual_consistency_translation_model_path = "Helsinki-NLP/opus-mt-ja-en"
 _factual_consistency_translation_pipeline: Pipeline | None = None
 
@@ -130,6 +130,8 @@ def _factual_consistency_local(
         A list of scores
     """
 
+    from transformers.pipelines import pipeline
+
     global _factual_consistency_translation_pipeline
     if _factual_consistency_translation_pipeline is None:
         _factual_consistency_translation_pipeline = pipeline(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 from sentence_transformers import SentenceTransformer
 from transformers.models.auto.modeling_auto import (
     AutoModelForSeq2SeqLM,
@@ -9,6 +11,10 @@ from transformers.models.auto.tokenization_auto import AutoTokenizer
 
 from langcheck._handle_logs import _handle_logging_level
 
+# Fast (Rust-backed) tokenizers release the GIL, so let them use their
+# internal parallelism unless the user configured it explicitly.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 
 def load_sentence_transformers(
     model_name: str,
@@ -68,8 +74,15 @@ def load_auto_model_for_text_classification(
     # There are "Some weights are not used warning" for some models, but we
     # ignore it because that is intended.
     with _handle_logging_level():
+        # Prefer the fast (Rust-backed) tokenizer, which can be an order of
+        # magnitude faster than the Python implementation. Models without a
+        # fast tokenizer (e.g. the Japanese DistilBERT models) automatically
+        # fall back to the slow one.
         tokenizer = AutoTokenizer.from_pretrained(
-            tokenizer_name, trust_remote_code=True, revision=tokenizer_revision
+            tokenizer_name,
+            trust_remote_code=True,
+            revision=tokenizer_revision,
+            use_fast=True,
         )
         model = AutoModelForSequenceClassification.from_pretrained(
             model_name, revision=model_revision
@@ -100,7 +113,7 @@ def load_auto_model_for_seq2seq(
     if tokenizer_name is None:
         tokenizer_name = model_name
     tokenizer = AutoTokenizer.from_pretrained(
-        tokenizer_name, revision=tokenizer_revision
+        tokenizer_name, revision=tokenizer_revision, use_fast=True
     )
     # There are "Some weights are not used warning" for some models, but we
     # ignore it because that is intended.
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar
-
-import torch
-from sentence_transformers import util
-from torch import Tensor
+import hashlib
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from langcheck.utils.progress_bar import tqdm_wrapper
 
+if TYPE_CHECKING:
+    from torch import Tensor
+
+# Process-wide cache of computed scores, keyed by the scorer's cache key and
+# a digest of the input text. Re-running a metric on texts that were already
+# scored in the same process then skips the model forward entirely.
+_score_cache: dict[tuple[str, bytes], float | None] = {}
+
+
+def clear_cache() -> None:
+    """Clear the process-wide cache of computed metric scores."""
+    _score_cache.clear()
+
+
 # Define a type variable for token type.
 # This type is used to represent the list of tokens returned by the
 # _tokenize method. We do not use `list` type because the token type
@@ -20,6 +31,9 @@ class BaseSingleScorer(Generic[_TokensType]):
 
     def __init__(self) -> None:
         self.batch_size = 8
+        # Subclasses opt into score caching by setting this to a string that
+        # identifies the model and every config that affects the scores.
+        self._cache_key: str | None = None
 
     def _tokenize(self, inputs: list[str]) -> _TokensType:
         """Tokenize the inputs. The returned type should be defined in the
@@ -43,7 +57,41 @@ class BaseSingleScorer(Generic[_TokensType]):
         raise NotImplementedError
 
     def score(self, inputs: list[str]) -> list[float | None]:
-        """Score the inputs. Basically subclasses should not override this."""
+        """Score the inputs. Basically subclasses should not override this.
+
+        Scores are memoized process-wide by content, so inputs that were
+        already scored by an equivalent scorer are returned from the cache
+        without running the model. Call
+        :func:`langcheck.metrics.clear_cache` to drop the memoized scores.
+        """
+        if self._cache_key is None:
+            return self._score_uncached(inputs)
+
+        digests = [
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            for text in inputs
+        ]
+        scores: list[float | None] = [None] * len(inputs)
+        uncached_indices = []
+        uncached_inputs = []
+        for i, digest in enumerate(digests):
+            key = (self._cache_key, digest)
+            if key in _score_cache:
+                scores[i] = _score_cache[key]
+            else:
+                uncached_indices.append(i)
+                uncached_inputs.append(inputs[i])
+
+        if uncached_inputs:
+            uncached_scores = self._score_uncached(uncached_inputs)
+            for i, score in zip(uncached_indices, uncached_scores):
+                _score_cache[(self._cache_key, digests[i])] = score
+                scores[i] = score
+
+        return scores
+
+    def _score_uncached(self, inputs: list[str]) -> list[float | None]:
+        """Score the inputs without consulting the score cache."""
 
         tokens = self._tokenize(inputs)
 
@@ -85,6 +133,9 @@ class BaseSimilarityScorer:
         element in the list should be the similarity score of the two
         embeddings.
         """
+        import torch
+        from sentence_transformers import util
+
         cosine_scores = util.pairwise_cos_sim(embedding1, embedding2)
         # Numerical instability can cause the dot product of almost identical
         # vectors to exceed 1.0 slightly, so we clip the outputs.
@@ -112,6 +163,8 @@ class BaseSimilarityScorer:
             embeddings1.append(self._embed(batch_inputs1))
             embeddings2.append(self._embed(batch_inputs2))
 
+        import torch
+
         # Concatenate the embeddings
         embedding1 = torch.cat(embeddings1, dim=0)
         embedding2 = torch.cat(embeddings2, dim=0)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import contextlib
+from functools import lru_cache
+
 import torch
 from transformers.models.bert import (
     BertForSequenceClassification,
@@ -14,6 +17,7 @@ from transformers.tokenization_utils_base import BatchEncoding
 from langcheck._handle_logs import _handle_logging_level
 
 from ._base import BaseSingleScorer
+from .hf_models import _autocast_context
 
 _checkpoints = {
     "en": "https://github.com/unitaryai/detoxify/releases/download/v0.1-alpha/toxic_original-c1212f89.ckpt",
@@ -26,6 +30,7 @@ _model_types = {
 }
 
 
+@lru_cache
 def load_checkpoint(
     device: str, lang: str
 ) -> tuple[
@@ -77,6 +82,7 @@ class DetoxifyScorer(BaseSingleScorer):
         lang: str = "en",
         overflow_strategy: str = "truncate",
         max_input_length: int | None = None,
+        quantize: bool = False,
     ):
         """
         Initialize the scorer with the provided configs.
@@ -88,6 +94,9 @@ class DetoxifyScorer(BaseSingleScorer):
                 The value should be either "raise", "truncate" or "nullify".
             max_input_length: The maximum length of the input. If None, the
                 maximum length of the model is used.
+            quantize: If True, apply dynamic INT8 quantization to the Linear
+                layers of the model, which speeds up CPU inference at the cost
+                of slightly different scores. Only supported on CPU.
         """
         super().__init__()
         self.model, self.tokenizer, self.class_names = load_checkpoint(
@@ -95,28 +104,65 @@ class DetoxifyScorer(BaseSingleScorer):
         )
         self.device = device
         self.model.to(self.device)  # type: ignore
+        self.model.eval()  # type: ignore
+        if quantize:
+            if device != "cpu":
+                raise ValueError("quantize=True is only supported on CPU.")
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model,  # type: ignore
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+            )
+        self._quantized = quantize
         self.overflow_strategy = overflow_strategy
         self.max_input_length = (
             max_input_length or self.tokenizer.model_max_length
         )
+        # Memoize scores per input text across equivalently configured
+        # scorers.
+        self._cache_key = str(
+            (
+                "detoxify",
+                lang,
+                device,
+                overflow_strategy,
+                self.max_input_length,
+                quantize,
+            )
+        )
 
     def _tokenize(self, inputs: list[str]) -> tuple[BatchEncoding, list[bool]]:
         """Tokenize the inputs. It also does the validation on the token length,
         and return the results as a list of boolean values. If the validation
         mode is 'raise', it raises an error when the token length is invalid.
         """
+        # Tokenize without padding here. The tokens are padded batch by batch
+        # in _score_tokens, so that one long input does not force every batch
+        # to be padded to its length.
         truncated_tokens = self.tokenizer(  # type: ignore
             inputs,
-            padding=True,
+            padding=False,
             truncation=True,
             max_length=self.max_input_length,
-            return_tensors="pt",
-        ).to(self.model.device)
+        )
 
         if self.overflow_strategy == "truncate":
             return (truncated_tokens, [True] * len(inputs))
 
-        input_validation_results = self._validate_inputs(inputs)
+        # Get the untruncated token lengths in a single batch call to validate
+        # the inputs, instead of re-encoding every input in a Python loop.
+        # Suppress the warning because we intentionally generate the tokens
+        # longer than the maximum length.
+        with _handle_logging_level():
+            lengths = self.tokenizer(  # type: ignore
+                inputs,
+                padding=False,
+                truncation=False,
+                return_length=True,
+            )["length"]
+        input_validation_results = [
+            length <= self.max_input_length for length in lengths
+        ]
 
         if self.overflow_strategy == "raise" and not all(
             input_validation_results
@@ -131,20 +177,6 @@ class DetoxifyScorer(BaseSingleScorer):
         # The user needs to exclude the invalid tokens from the results.
         return (truncated_tokens, input_validation_results)
 
-    def _validate_inputs(self, inputs: list[str]) -> list[bool]:
-        """Validation based on the maximum input length of the model."""
-
-        validation_results = []
-        for input_str in inputs:
-            # Tokenize the input and get the length of the input_ids
-            # Suppress the warning because we intentionally generate the
-            # tokens longer than the maximum length.
-            with _handle_logging_level():
-                input_ids = self.tokenizer.encode(input_str)  # type: ignore
-            validation_results.append(len(input_ids) <= self.max_input_length)
-
-        return validation_results
-
     def _slice_tokens(
         self,
         tokens: tuple[BatchEncoding, list[bool]],
@@ -154,10 +186,12 @@ class DetoxifyScorer(BaseSingleScorer):
         input_tokens, validation_results = tokens
 
         return (
-            {
-                key: value[start_idx:end_idx]
-                for key, value in input_tokens.items()
-            },  # type: ignore
+            BatchEncoding(
+                {
+                    key: value[start_idx:end_idx]
+                    for key, value in input_tokens.items()
+                }
+            ),
             validation_results[start_idx:end_idx],
         )
 
@@ -165,14 +199,22 @@ class DetoxifyScorer(BaseSingleScorer):
         self, tokens: tuple[BatchEncoding, list[bool]]
     ) -> list[float | None]:
         input_tokens, validation_results = tokens
-        out = self.model(**input_tokens)[0]
-        scores = torch.sigmoid(out).cpu().detach().numpy()
-        results = {}
-        for i, cla in enumerate(self.class_names):
-            results[cla] = [
-                scores[ex_i][i].tolist() for ex_i in range(len(scores))
-            ]
-        toxicity_scores = results["toxicity"]
+        # Pad only up to the longest sequence in this batch.
+        batch_tokens = self.tokenizer.pad(  # type: ignore
+            input_tokens, return_tensors="pt"
+        ).to(self.model.device)
+        if self._quantized:
+            # The dynamically quantized Linear kernels only accept float32
+            # inputs, so autocast must stay off for quantized models.
+            autocast_context = contextlib.nullcontext()
+        else:
+            autocast_context = _autocast_context(self.model.device.type)
+        with torch.inference_mode(), autocast_context:
+            out = self.model(**batch_tokens)[0]
+        toxicity_idx = self.class_names.index("toxicity")
+        toxicity_scores: list[float | None] = (
+            torch.sigmoid(out.float())[:, toxicity_idx].cpu().tolist()
+        )
 
         for i, validation_result in enumerate(validation_results):
             if not validation_result:
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import math
+from pathlib import Path
+
+import numpy as np
 import torch
 from transformers.tokenization_utils_base import BatchEncoding
 
@@ -8,6 +14,64 @@ from langcheck._handle_logs import _handle_logging_level
 from ._base import BaseSimilarityScorer, BaseSingleScorer
 
 
+def _load_onnx_model(model_name: str):
+    """Load a sequence classification model exported to ONNX Runtime.
+
+    The exported graph is cached under ~/.cache/langcheck/onnx so the
+    export cost is only paid on the first use of a model.
+    """
+    try:
+        # Ignore the missing imports error since optimum is optional.
+        from optimum.onnxruntime import (  # type: ignore[reportMissingImports]
+            ORTModelForSequenceClassification,
+        )
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "No module named 'optimum'.\n"
+            "Since ONNX Runtime inference is an optional feature, 'optimum' "
+            "is not installed by default along with langcheck. Please install "
+            "it with `pip install langcheck[onnx]`."
+        )
+
+    cache_dir = (
+        Path.home() / ".cache" / "langcheck" / "onnx"
+    ) / model_name.replace("/", "--")
+    if cache_dir.exists():
+        return ORTModelForSequenceClassification.from_pretrained(cache_dir)
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        model_name, export=True
+    )
+    model.save_pretrained(cache_dir)
+    return model
+
+
+def _autocast_context(
+    device_type: str,
+) -> contextlib.AbstractContextManager:
+    """Return an autocast context manager for mixed-precision inference.
+
+    On CUDA devices this uses bfloat16 when supported, and float16 otherwise.
+    On CPUs, bfloat16 autocast is only worthwhile with AVX-512, so other CPUs
+    keep running in full precision.
+    """
+    if device_type == "cuda":
+        dtype = (
+            torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        )
+        return torch.autocast(device_type="cuda", dtype=dtype)
+    # torch.backends.cpu.get_cpu_capability was added in torch 2.1, so
+    # older versions fall back to full precision on CPU.
+    cpu_backend = getattr(torch.backends, "cpu", None)
+    if (
+        cpu_backend is not None
+        and hasattr(cpu_backend, "get_cpu_capability")
+        and cpu_backend.get_cpu_capability() == "AVX512"
+    ):
+        return torch.autocast(device_type="cpu", dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+
 class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
     """Scorer using Hugging Face's AutoModelForSequenceClassification."""
 
@@ -18,6 +82,9 @@ class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
         class_weights,
         overflow_strategy: str = "truncate",
         max_input_length: int | None = None,
+        quantize: bool = False,
+        use_onnx: bool = False,
+        torch_compile: bool = False,
     ):
         """
         Initialize the scorer with the provided configs.
@@ -31,6 +98,15 @@ class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
                 The value should be either "raise", "truncate" or "nullify".
             max_input_length: The maximum length of the input. If None, the
                 maximum length of the model is used.
+            quantize: If True, apply dynamic INT8 quantization to the Linear
+                layers of the model, which speeds up CPU inference at the cost
+                of slightly different scores.
+            use_onnx: If True, run the model with ONNX Runtime instead of
+                PyTorch, which fuses attention and LayerNorm ops for faster
+                CPU inference. Requires the optional 'optimum' dependency.
+            torch_compile: If True, wrap the model with torch.compile for
+                fused kernels. The compilation cost is only worth it when
+                scoring many batches with the same scorer.
         """
 
         super().__init__()
@@ -41,29 +117,99 @@ class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
 
         self.tokenizer = tokenizer
         self.model = model
+        if use_onnx:
+            if quantize:
+                raise ValueError(
+                    "quantize=True and use_onnx=True cannot be combined."
+                )
+            # The model name is needed to export the ONNX graph, so look it
+            # up in the model manager's configuration.
+            model_name = manager.config[language][metric]["model_name"]
+            self.model = _load_onnx_model(model_name)
+        if quantize:
+            # The model cached in the model manager is shared and may have
+            # been moved to CUDA by another scorer, while the INT8 kernels
+            # are CPU-only, so quantize a CPU copy of it. Quantizing the
+            # copy in place avoids a third copy of the weights.
+            model_copy = copy.deepcopy(self.model).to("cpu")  # type: ignore
+            self.model = torch.ao.quantization.quantize_dynamic(
+                model_copy,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+                inplace=True,
+            )
+        if isinstance(self.model, torch.nn.Module):
+            # ONNX Runtime models are not torch modules and are always in
+            # inference mode.
+            self.model.eval()
+        self._quantized = quantize
+        if quantize or use_onnx:
+            # The INT8 and ONNX Runtime kernels are CPU-only.
+            self.device = "cpu"
+        else:
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.model = self.model.to(self.device)  # type: ignore
+            if torch_compile:
+                self.model = torch.compile(self.model)  # type: ignore
         self.class_weights = class_weights
+        # Precompute the weights as a tensor on the scorer's device so that
+        # _logits_to_scores can apply them in a single matrix-vector product
+        # without a per-batch transfer.
+        self._class_weights_tensor = torch.as_tensor(
+            class_weights, dtype=torch.float32, device=self.device
+        )
         if max_input_length is not None:
             self.max_input_length: int = max_input_length
         else:
             self.max_input_length = self.model.config.max_position_embeddings  # type: ignore
+        # Memoize scores per input text across equivalently configured
+        # scorers. torch_compile is excluded since it does not change the
+        # computed scores.
+        self._cache_key = str(
+            (
+                language,
+                metric,
+                tuple(class_weights),
+                overflow_strategy,
+                self.max_input_length,
+                quantize,
+                use_onnx,
+                self.device,
+            )
+        )
 
     def _tokenize(self, inputs: list[str]) -> tuple[BatchEncoding, list[bool]]:
         """Tokenize the inputs. It also does the validation on the token length,
         and return the results as a list of boolean values. If the validation
         mode is 'raise', it raises an error when the token length is invalid.
         """
+        # Tokenize without padding here. The tokens are padded batch by batch
+        # in _score_tokens, so that one long input does not force every batch
+        # to be padded to its length.
         truncated_tokens = self.tokenizer(  # type: ignore
             inputs,
-            padding=True,
+            padding=False,
             truncation=True,
             max_length=self.max_input_length,
-            return_tensors="pt",
         )
 
         if self.overflow_strategy == "truncate":
             return (truncated_tokens, [True] * len(inputs))
 
-        input_validation_results = self._validate_inputs(inputs)
+        # Get the untruncated token lengths in a single batch call to validate
+        # the inputs, instead of re-encoding every input in a Python loop.
+        # Suppress the warning because we intentionally generate the tokens
+        # longer than the maximum length.
+        with _handle_logging_level():
+            lengths = self.tokenizer(  # type: ignore
+                inputs,
+                padding=False,
+                truncation=False,
+                return_length=True,
+            )["length"]
+        input_validation_results = [
+            length <= self.max_input_length for length in lengths
+        ]
 
         if self.overflow_strategy == "raise" and not all(
             input_validation_results
@@ -78,34 +224,38 @@ class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
         # The user needs to exclude the invalid tokens from the results.
         return (truncated_tokens, input_validation_results)
 
-    def _validate_inputs(self, inputs: list[str]) -> list[bool]:
-        """Validation based on the maximum input length of the model."""
-
-        validation_results = []
-        for input_str in inputs:
-            # Tokenize the input and get the length of the input_ids
-            # Suppress the warning because we intentionally generate the
-            # tokens longer than the maximum length.
-            with _handle_logging_level():
-                input_ids = self.tokenizer.encode(input_str)  # type: ignore
-            validation_results.append(len(input_ids) <= self.max_input_length)
-
-        return validation_results
-
     def _score_tokens(
         self, tokens: tuple[BatchEncoding, list[bool]]
     ) -> list[float | None]:
         """Return the prediction results as scores."""
         input_tokens, validation_results = tokens
-        with torch.no_grad():
-            logits: torch.Tensor = self.model(**input_tokens).logits  # type: ignore
-            scores: list[float | None] = self._logits_to_scores(logits)  # type: ignore
-
-        for i, validation_result in enumerate(validation_results):
-            if not validation_result:
-                scores[i] = None
-
-        return scores
+        # Pad only up to the longest sequence in this batch.
+        batch_tokens = self.tokenizer.pad(  # type: ignore
+            input_tokens, return_tensors="pt"
+        ).to(self.device)
+        if self._quantized:
+            # The dynamically quantized Linear kernels only accept float32
+            # inputs, so autocast must stay off for quantized models.
+            autocast_context = contextlib.nullcontext()
+        else:
+            autocast_context = _autocast_context(self.device)
+        with torch.inference_mode(), autocast_context:
+            logits: torch.Tensor = self.model(**batch_tokens).logits  # type: ignore
+        # Convert outside the autocast context, which would re-cast the
+        # weighted-sum matmul to a lower precision that NumPy cannot
+        # represent (bfloat16).
+        scores_array = self._logits_to_scores(logits)
+
+        if all(validation_results):
+            return scores_array.tolist()
+
+        # Mark the scores of invalid inputs with NaN inside the array, and
+        # only convert to None at the list boundary.
+        scores_array = np.where(validation_results, scores_array, np.nan)
+        return [
+            None if math.isnan(score) else score
+            for score in scores_array.tolist()
+        ]
 
     def _slice_tokens(
         self,
@@ -116,22 +266,23 @@ class AutoModelForSequenceClassificationScorer(BaseSingleScorer):
         input_tokens, validation_results = tokens
 
         return (
-            {
-                key: value[start_idx:end_idx]
-                for key, value in input_tokens.items()
-            },  # type: ignore
+            BatchEncoding(
+                {
+                    key: value[start_idx:end_idx]
+                    for key, value in input_tokens.items()
+                }
+            ),
             validation_results[start_idx:end_idx],
         )
 
-    def _logits_to_scores(self, logits: torch.Tensor) -> list[float]:
+    def _logits_to_scores(self, logits: torch.Tensor) -> np.ndarray:
         """Turn the logits returned from the models to scores."""
-        probs = torch.nn.functional.softmax(logits, dim=1)
-        scores = torch.zeros(probs.shape[0], dtype=torch.float32)
-
-        for i, class_weight in enumerate(self.class_weights):
-            scores += probs[:, i] * class_weight
-
-        return scores.tolist()
+        # The dtype argument folds the cast back to full precision into the
+        # softmax kernel, keeping it numerically stable after an autocast
+        # forward pass without materializing a float32 copy of the logits.
+        probs = torch.nn.functional.softmax(logits, dim=1, dtype=torch.float32)
+        scores = probs @ self._class_weights_tensor
+        return scores.cpu().numpy()
 
 
 class SentenceTransformerSimilarityScorer(BaseSimilarityScorer):
@@ -8,9 +8,6 @@ from langcheck.metrics.metric_inputs import (
     get_metric_inputs_with_required_lists,
 )
 from langcheck.metrics.metric_value import MetricValue
-from langcheck.metrics.scorer.hf_models import (
-    SentenceTransformerSimilarityScorer,
-)
 from langcheck.metrics.zh._tokenizers import HanLPTokenizer
 
 LANG = "zh"
@@ -71,6 +68,10 @@ def semantic_similarity(
     )
 
     if eval_model == "local":
+        from langcheck.metrics.scorer.hf_models import (
+            SentenceTransformerSimilarityScorer,
+        )
+
         scorer = SentenceTransformerSimilarityScorer(language="zh")
     else:  # EvalClient
         assert isinstance(eval_model, EvalClient), (
@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import hanlp
-from transformers.pipelines import pipeline
-
 from langcheck.metrics.en.reference_free_text_quality import (
     sentiment as en_sentiment,
 )
@@ -70,6 +67,8 @@ def sentiment(
         return metric_value
 
     # {0:"Negative", 1:'Positive'}
+    from transformers.pipelines import pipeline
+
     from langcheck.metrics.model_manager import manager
 
     tokenizer, model = manager.fetch_model(language="zh", metric="sentiment")
@@ -182,6 +181,8 @@ def _toxicity_local(generated_outputs: list[str]) -> list[float]:
     """
     # this pipeline output predict probability for each text on each label.
     # the output format is list[list[dict(str)]]
+    from transformers.pipelines import pipeline
+
     from langcheck.metrics.model_manager import manager
 
     tokenizer, model = manager.fetch_model(language="zh", metric="toxicity")
@@ -238,6 +239,8 @@ def xuyaochen_report_readability(
         prompts=prompts,
         required_params=["generated_outputs"],
     )
+    import hanlp
+
     tokenizer = hanlp.load(
         hanlp.pretrained.tok.FINE_ELECTRA_SMALL_ZH  # type: ignore[reportGeneralTypeIssues]
     )
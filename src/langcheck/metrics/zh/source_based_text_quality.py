@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import cast
 
-from transformers.pipelines import pipeline
-
 from langcheck.metrics.en.source_based_text_quality import (
     factual_consistency as en_factual_consistency,
 )
@@ -74,6 +72,8 @@ def factual_consistency(
         metric_value.language = "zh"
         return metric_value
 
+    from transformers.pipelines import pipeline
+
     from langcheck.metrics.model_manager import manager
 
     tokenizer, model = manager.fetch_model(
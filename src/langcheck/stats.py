@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import os
 import string
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import nltk
+import numpy as np
 from nltk.corpus import cmudict
 from nltk.tokenize import SyllableTokenizer
 
+from langcheck.utils.progress_bar import tqdm_wrapper
+
 
 @dataclass
 class TextStats:
@@ -13,16 +20,87 @@ class TextStats:
     num_syllables: int
 
 
-def compute_stats(input_text: str) -> TextStats:
-    """Compute statics about the given input text.
+# Below this many texts, the process startup and pickling overhead of the
+# process pool outweighs the parallel speedup.
+_MIN_PARALLEL_INPUTS = 64
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def compute_stats_batch(input_texts: list[str]) -> list[TextStats]:
+    """Compute statistics for a batch of texts.
+
+    Syllable counting is CPU-bound pure Python and independent across texts,
+    so large batches are spread over a process pool; small batches are
+    processed serially.
 
     Args:
-        input_text: Text you want to compute the stats for
+        input_texts: Texts you want to compute the stats for
 
     Returns:
-        A :class:`~langcheck.stats.TextStats` object
+        A list of :class:`~langcheck.stats.TextStats` objects
+    """
+    if len(input_texts) < _MIN_PARALLEL_INPUTS:
+        return [
+            compute_stats(text)
+            for text in tqdm_wrapper(input_texts, desc="Computing stats")
+        ]
+
+    # Download the nltk resources once in the parent process, so the pool
+    # workers do not race to download and unzip the same corpora.
+    _ensure_nltk_data()
+
+    num_workers = os.cpu_count() or 1
+    chunksize = max(1, len(input_texts) // (4 * num_workers))
+    return list(
+        tqdm_wrapper(
+            _get_executor().map(
+                compute_stats, input_texts, chunksize=chunksize
+            ),
+            desc="Computing stats",
+            total=len(input_texts),
+        )
+    )
+
+
+def stats_to_arrays(
+    stats: list[TextStats],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unpack a list of text statistics into three NumPy arrays, so that
+    formulas over them (e.g. readability scores) can be evaluated as a single
+    vectorized expression instead of a Python loop.
+
+    Args:
+        stats: A list of :class:`~langcheck.stats.TextStats` objects
+
+    Returns:
+        A (num_sentences, num_words, num_syllables) tuple of arrays
     """
+    num_sentences = np.fromiter(
+        (stat.num_sentences for stat in stats),
+        dtype=np.int64,
+        count=len(stats),
+    )
+    num_words = np.fromiter(
+        (stat.num_words for stat in stats), dtype=np.int64, count=len(stats)
+    )
+    num_syllables = np.fromiter(
+        (stat.num_syllables for stat in stats),
+        dtype=np.int64,
+        count=len(stats),
+    )
+    return num_sentences, num_words, num_syllables
 
+
+def _ensure_nltk_data() -> None:
+    """Download the nltk resources used by compute_stats if missing."""
     try:
         nltk.data.find("tokenizers/punkt_tab")
     except LookupError:
@@ -33,6 +111,19 @@ def compute_stats(input_text: str) -> TextStats:
     except LookupError:
         nltk.download("cmudict")
 
+
+def compute_stats(input_text: str) -> TextStats:
+    """Compute statics about the given input text.
+
+    Args:
+        input_text: Text you want to compute the stats for
+
+    Returns:
+        A :class:`~langcheck.stats.TextStats` object
+    """
+
+    _ensure_nltk_data()
+
     sentences = nltk.tokenize.sent_tokenize(input_text)
 
     words = sum(
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+from langcheck.metrics import clear_cache
+from langcheck.metrics.scorer._base import BaseSingleScorer
+
+
+class StubScorer(BaseSingleScorer):
+    """Scorer that records which inputs actually reached the model."""
+
+    def __init__(self, cache_key: str | None = "stub") -> None:
+        super().__init__()
+        self._cache_key = cache_key
+        self.scored_inputs: list[str] = []
+
+    def _tokenize(self, inputs: list[str]) -> list[str]:
+        return list(inputs)
+
+    def _slice_tokens(
+        self, tokens: list[str], start_idx: int, end_idx: int
+    ) -> list[str]:
+        return tokens[start_idx:end_idx]
+
+    def _score_tokens(self, tokens: list[str]) -> list[float | None]:
+        self.scored_inputs.extend(tokens)
+        return [
+            None if text == "invalid" else float(len(text)) for text in tokens
+        ]
+
+
+@pytest.fixture(autouse=True)
+def _isolate_score_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_cached_scores_skip_the_model():
+    scorer = StubScorer()
+    assert scorer.score(["a", "bb", "ccc"]) == [1.0, 2.0, 3.0]
+    assert scorer.scored_inputs == ["a", "bb", "ccc"]
+
+    # A repeat call, in a different order, is served from the cache.
+    assert scorer.score(["ccc", "a", "bb"]) == [3.0, 1.0, 2.0]
+    assert scorer.scored_inputs == ["a", "bb", "ccc"]
+
+    # Only the unseen input reaches the model.
+    assert scorer.score(["dddd", "a"]) == [4.0, 1.0]
+    assert scorer.scored_inputs == ["a", "bb", "ccc", "dddd"]
+
+
+def test_none_scores_are_cached():
+    scorer = StubScorer()
+    assert scorer.score(["invalid", "a"]) == [None, 1.0]
+    assert scorer.score(["invalid"]) == [None]
+    assert scorer.scored_inputs == ["invalid", "a"]
+
+
+def test_different_cache_keys_do_not_share_scores():
+    scorer = StubScorer(cache_key="one")
+    other = StubScorer(cache_key="two")
+    assert scorer.score(["a"]) == [1.0]
+    assert other.score(["a"]) == [1.0]
+    assert scorer.scored_inputs == ["a"]
+    assert other.scored_inputs == ["a"]
+
+
+def test_clear_cache():
+    scorer = StubScorer()
+    assert scorer.score(["a"]) == [1.0]
+    clear_cache()
+    assert scorer.score(["a"]) == [1.0]
+    assert scorer.scored_inputs == ["a", "a"]
+
+
+def test_no_cache_key_disables_caching():
+    scorer = StubScorer(cache_key=None)
+    assert scorer.score(["a"]) == [1.0]
+    assert scorer.score(["a"]) == [1.0]
+    assert scorer.scored_inputs == ["a", "a"]
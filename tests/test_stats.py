@@ -1,6 +1,13 @@
+import numpy as np
 import pytest
 
-from langcheck.stats import compute_stats
+from langcheck.stats import (
+    _MIN_PARALLEL_INPUTS,
+    TextStats,
+    compute_stats,
+    compute_stats_batch,
+    stats_to_arrays,
+)
 
 ################################################################################
 # Tests
@@ -32,3 +39,31 @@ def test_compute_stats(input_text, num_sentences, num_words, num_syllables):
     assert stats.num_sentences == num_sentences
     assert stats.num_words == num_words
     assert stats.num_syllables == num_syllables
+
+
+@pytest.mark.parametrize(
+    "num_texts",
+    [
+        3,  # Serial path
+        _MIN_PARALLEL_INPUTS,  # Parallel path
+    ],
+)
+def test_compute_stats_batch(num_texts):
+    input_texts = [
+        "My Friend. Welcome to the Carpathians.",
+        "I am anxiously expecting you.",
+        "How slowly the time passes here!",
+    ] * (num_texts // 3) + ["Sleep well to-night."] * (num_texts % 3)
+    batch_stats = compute_stats_batch(input_texts)
+    assert batch_stats == [compute_stats(text) for text in input_texts]
+
+
+def test_stats_to_arrays():
+    stats = [
+        TextStats(num_sentences=2, num_words=6, num_syllables=10),
+        TextStats(num_sentences=1, num_words=5, num_syllables=7),
+    ]
+    num_sentences, num_words, num_syllables = stats_to_arrays(stats)
+    assert np.array_equal(num_sentences, [2, 1])
+    assert np.array_equal(num_words, [6, 5])
+    assert np.array_equal(num_syllables, [10, 7])